@@ -38,9 +38,11 @@ COMMANDS = [
 class Config:
     """Config class for qBittorrent-Manage"""
 
-    def __init__(self, default_dir, args):
+    def __init__(self, default_dir, args, client_cache=None):
         logger.info("Locating config...")
         self.args = args
+        # Authenticated qBittorrent clients shared between config files, keyed by connection parameters
+        self.client_cache = client_cache if client_cache is not None else {}
         config_file = args["config_file"]
         if config_file and os.path.exists(config_file):
             self.config_path = os.path.abspath(config_file)
@@ -102,15 +102,13 @@ class MyLogger:
         self._logger.removeHandler(self.main_handler)
 
     def add_config_handler(self, config_key):
-        """Add config handler to logger"""
-        if config_key in self.config_handlers:
-            self._logger.addHandler(self.config_handlers[config_key])
-        else:
+        """Add config handler to logger, creating it only the first time the config is seen"""
+        if config_key not in self.config_handlers:
             self.config_handlers[config_key] = self._get_handler(os.path.join(self.log_dir, config_key + ".log"))
-            self._logger.addHandler(self.config_handlers[config_key])
+        self._logger.addHandler(self.config_handlers[config_key])
 
     def remove_config_handler(self, config_key):
-        """Remove config handler from logger"""
+        """Remove config handler from logger, keeping it open for the next run"""
         if config_key in self.config_handlers:
             self._logger.removeHandler(self.config_handlers[config_key])
 
@@ -163,8 +161,12 @@ class MyLogger:
             self._log(DEBUG, str(msg), args, **kwargs)
 
     def info_center(self, msg, *args, **kwargs):
-        """Print info centered"""
-        self.info(self._centered(str(msg)), *args, **kwargs)
+        """Print info centered, msg can also be a list of lines to print as one block"""
+        if not self._logger.isEnabledFor(INFO):
+            return
+        lines = msg if isinstance(msg, (list, tuple)) else [msg]
+        for line in lines:
+            self._log(INFO, self._centered(str(line)), args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
         """Print info"""
@@ -39,14 +39,20 @@ class Qbt:
         logger.debug(f"Host: {self.host}")
         ex = ""
         try:
-            self.client = Client(
-                host=self.host,
-                username=self.username,
-                password=self.password,
-                VERIFY_WEBUI_CERTIFICATE=False,
-                REQUESTS_ARGS={"timeout": (45, 60)},
-            )
-            self.client.auth_log_in()
+            client_key = (self.host, self.username, self.password)
+            self.client = self.config.client_cache.get(client_key)
+            if self.client is None:
+                self.client = Client(
+                    host=self.host,
+                    username=self.username,
+                    password=self.password,
+                    VERIFY_WEBUI_CERTIFICATE=False,
+                    REQUESTS_ARGS={"timeout": (45, 60)},
+                )
+                self.client.auth_log_in()
+                self.config.client_cache[client_key] = self.client
+            else:
+                logger.debug("Reusing existing qBittorrent session")
             self.current_version = self.client.app.version
             logger.info(f"qBittorrent: {self.current_version}")
             logger.info(f"qBittorrent Web API: {self.client.app.web_api_version}")
@@ -5,6 +5,7 @@ import logging
 import os
 import shutil
 import signal
+import threading
 import time
 from fnmatch import fnmatch
 from pathlib import Path
@@ -746,15 +747,19 @@ class GracefulKiller:
     Gracefully kill script when docker stops.
     """
 
-    kill_now = False
-
     def __init__(self):
+        self.event = threading.Event()
         # signal.signal(signal.SIGINT, self.exit_gracefully)
         signal.signal(signal.SIGTERM, self.exit_gracefully)
 
+    @property
+    def kill_now(self):
+        """Return True once a termination signal has been received."""
+        return self.event.is_set()
+
     def exit_gracefully(self, *args):
-        """Set kill_now to True to exit gracefully."""
-        self.kill_now = True
+        """Set the kill event, waking up anything waiting on it, to exit gracefully."""
+        self.event.set()
 
 
 def human_readable_size(size, decimal_places=3):
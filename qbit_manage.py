@@ -2,12 +2,12 @@
 """qBittorrent Manager."""
 
 import argparse
-import glob
-import math
+import fnmatch
 import os
 import platform
+import re
 import sys
-import time
+from collections import Counter
 from datetime import datetime
 from datetime import timedelta
 from functools import lru_cache
@@ -18,8 +18,8 @@ try:
     from humanize import precisedelta
 
     from modules.logs import MyLogger
-except ModuleNotFoundError:
-    print("Requirements Error: Requirements are not installed")
+except ModuleNotFoundError as err:
+    print(f'Requirements Error: {err.name} not installed. Please install the requirements using "pip install ."')
     sys.exit(1)
 
 REQUIRED_VERSION = (3, 8, 1)
@@ -33,172 +33,269 @@ if current_version < (REQUIRED_VERSION):
     )
     sys.exit(1)
 
-parser = argparse.ArgumentParser("qBittorrent Manager.", description="A mix of scripts combined for managing qBittorrent.")
-parser.add_argument("-db", "--debug", dest="debug", help=argparse.SUPPRESS, action="store_true", default=False)
-parser.add_argument("-tr", "--trace", dest="trace", help=argparse.SUPPRESS, action="store_true", default=False)
-parser.add_argument(
-    "-r",
-    "--run",
-    dest="run",
-    action="store_true",
-    default=False,
-    help="Run without the scheduler. Script will exit after completion.",
-)
-parser.add_argument(
-    "-sch",
-    "--schedule",
-    dest="schedule",
-    default="1440",
-    type=str,
-    help=(
-        "Schedule to run every x minutes. (Default set to 1440 (1 day))."
-        "Can also customize schedule via cron syntax (See https://crontab.guru/examples.html)"
+# Command line arguments as (short flag, long flag, argparse options)
+ARGUMENTS = [
+    (
+        "-db",
+        "--debug",
+        {
+            "dest": "debug",
+            "help": argparse.SUPPRESS,
+            "action": "store_true",
+            "default": False,
+        },
     ),
-)
-parser.add_argument(
-    "-sd",
-    "--startup-delay",
-    dest="startupDelay",
-    default="0",
-    type=str,
-    help="Set delay in seconds on the first run of a schedule (Default set to 0)",
-)
-parser.add_argument(
-    "-c",
-    "--config-file",
-    dest="configfiles",
-    action="store",
-    default="config.yml",
-    type=str,
-    help=(
-        "This is used if you want to use a different name for your config.yml or if you want to load multiple"
-        "config files using *. Example: tv.yml or config*.yml"
+    (
+        "-tr",
+        "--trace",
+        {
+            "dest": "trace",
+            "help": argparse.SUPPRESS,
+            "action": "store_true",
+            "default": False,
+        },
     ),
-)
-parser.add_argument(
-    "-lf",
-    "--log-file",
-    dest="logfile",
-    action="store",
-    default="qbit_manage.log",
-    type=str,
-    help="This is used if you want to use a different name for your log file. Example: tv.log",
-)
-parser.add_argument(
-    "-re",
-    "--recheck",
-    dest="recheck",
-    action="store_true",
-    default=False,
-    help="Recheck paused torrents sorted by lowest size. Resume if Completed.",
-)
-parser.add_argument(
-    "-cu",
-    "--cat-update",
-    dest="cat_update",
-    action="store_true",
-    default=False,
-    help="Use this if you would like to update your categories.",
-)
-parser.add_argument(
-    "-tu",
-    "--tag-update",
-    dest="tag_update",
-    action="store_true",
-    default=False,
-    help=(
-        "Use this if you would like to update your tags and/or set seed goals/limit upload speed by tag."
-        " (Only adds tags to untagged torrents)"
+    (
+        "-r",
+        "--run",
+        {
+            "dest": "run",
+            "action": "store_true",
+            "default": False,
+            "help": "Run without the scheduler. Script will exit after completion.",
+        },
     ),
-)
-parser.add_argument(
-    "-ru",
-    "--rem-unregistered",
-    dest="rem_unregistered",
-    action="store_true",
-    default=False,
-    help="Use this if you would like to remove unregistered torrents.",
-)
-parser.add_argument(
-    "-tte",
-    "--tag-tracker-error",
-    dest="tag_tracker_error",
-    action="store_true",
-    default=False,
-    help="Use this if you would like to tag torrents that do not have a working tracker.",
-)
-parser.add_argument(
-    "-ro",
-    "--rem-orphaned",
-    dest="rem_orphaned",
-    action="store_true",
-    default=False,
-    help="Use this if you would like to remove orphaned files.",
-)
-parser.add_argument(
-    "-tnhl",
-    "--tag-nohardlinks",
-    dest="tag_nohardlinks",
-    action="store_true",
-    default=False,
-    help=(
-        "Use this to tag any torrents that do not have any hard links associated with any of the files. "
-        "This is useful for those that use Sonarr/Radarr which hard link your media files with the torrents for seeding. "
-        "When files get upgraded they no longer become linked with your media therefore will be tagged with a new tag noHL. "
-        "You can then safely delete/remove these torrents to free up any extra space that is not being used by your media folder."
+    (
+        "-sch",
+        "--schedule",
+        {
+            "dest": "schedule",
+            "default": "1440",
+            "type": str,
+            "help": (
+                "Schedule to run every x minutes. (Default set to 1440 (1 day))."
+                "Can also customize schedule via cron syntax (See https://crontab.guru/examples.html)"
+            ),
+        },
     ),
-)
-parser.add_argument(
-    "-sl",
-    "--share-limits",
-    dest="share_limits",
-    action="store_true",
-    default=False,
-    help=(
-        "Use this to help apply and manage your torrent share limits based on your tags/categories."
-        "This can apply a max ratio, seed time limits to your torrents or limit your torrent upload speed as well."
-        "Share limits are applied in the order of priority specified."
+    (
+        "-sd",
+        "--startup-delay",
+        {
+            "dest": "startupDelay",
+            "default": "0",
+            "type": str,
+            "help": "Set delay in seconds on the first run of a schedule (Default set to 0)",
+        },
     ),
-)
-parser.add_argument(
-    "-sc",
-    "--skip-cleanup",
-    dest="skip_cleanup",
-    action="store_true",
-    default=False,
-    help="Use this to skip cleaning up Recycle Bin/Orphaned directory.",
-)
-parser.add_argument(
-    "-svc",
-    "--skip-qb-version-check",
-    dest="skip_qb_version_check",
-    action="store_true",
-    default=False,
-    # help="Bypass qBittorrent/libtorrent version compatibility check. "
-    # "You run the risk of undesirable behavior and will receive no support.",
-    help=argparse.SUPPRESS,
-)
-parser.add_argument(
-    "-dr",
-    "--dry-run",
-    dest="dry_run",
-    action="store_true",
-    default=False,
-    help="If you would like to see what is gonna happen but not actually move/delete or tag/categorize anything.",
-)
-parser.add_argument(
-    "-ll", "--log-level", dest="log_level", action="store", default="INFO", type=str, help="Change your log level."
-)
-parser.add_argument(
-    "-d", "--divider", dest="divider", help="Character that divides the sections (Default: '=')", default="=", type=str
-)
-parser.add_argument("-w", "--width", dest="width", help="Screen Width (Default: 100)", default=100, type=int)
-parser.add_argument(
-    "-ls", "--log-size", dest="log_size", action="store", default=10, type=int, help="Maximum log size per file (in MB)"
-)
-parser.add_argument(
-    "-lc", "--log-count", dest="log_count", action="store", default=5, type=int, help="Maximum mumber of logs to keep"
-)
+    (
+        "-c",
+        "--config-file",
+        {
+            "dest": "configfiles",
+            "action": "store",
+            "default": "config.yml",
+            "type": str,
+            "help": (
+                "This is used if you want to use a different name for your config.yml or if you want to load multiple"
+                "config files using *. Example: tv.yml or config*.yml"
+            ),
+        },
+    ),
+    (
+        "-lf",
+        "--log-file",
+        {
+            "dest": "logfile",
+            "action": "store",
+            "default": "qbit_manage.log",
+            "type": str,
+            "help": "This is used if you want to use a different name for your log file. Example: tv.log",
+        },
+    ),
+    (
+        "-re",
+        "--recheck",
+        {
+            "dest": "recheck",
+            "action": "store_true",
+            "default": False,
+            "help": "Recheck paused torrents sorted by lowest size. Resume if Completed.",
+        },
+    ),
+    (
+        "-cu",
+        "--cat-update",
+        {
+            "dest": "cat_update",
+            "action": "store_true",
+            "default": False,
+            "help": "Use this if you would like to update your categories.",
+        },
+    ),
+    (
+        "-tu",
+        "--tag-update",
+        {
+            "dest": "tag_update",
+            "action": "store_true",
+            "default": False,
+            "help": (
+                "Use this if you would like to update your tags and/or set seed goals/limit upload speed by tag."
+                " (Only adds tags to untagged torrents)"
+            ),
+        },
+    ),
+    (
+        "-ru",
+        "--rem-unregistered",
+        {
+            "dest": "rem_unregistered",
+            "action": "store_true",
+            "default": False,
+            "help": "Use this if you would like to remove unregistered torrents.",
+        },
+    ),
+    (
+        "-tte",
+        "--tag-tracker-error",
+        {
+            "dest": "tag_tracker_error",
+            "action": "store_true",
+            "default": False,
+            "help": "Use this if you would like to tag torrents that do not have a working tracker.",
+        },
+    ),
+    (
+        "-ro",
+        "--rem-orphaned",
+        {
+            "dest": "rem_orphaned",
+            "action": "store_true",
+            "default": False,
+            "help": "Use this if you would like to remove orphaned files.",
+        },
+    ),
+    (
+        "-tnhl",
+        "--tag-nohardlinks",
+        {
+            "dest": "tag_nohardlinks",
+            "action": "store_true",
+            "default": False,
+            "help": (
+                "Use this to tag any torrents that do not have any hard links associated with any of the files. "
+                "This is useful for those that use Sonarr/Radarr which hard link your media files with the torrents for "
+                "seeding. When files get upgraded they no longer become linked with your media therefore will be tagged "
+                "with a new tag noHL. You can then safely delete/remove these torrents to free up any extra space that is "
+                "not being used by your media folder."
+            ),
+        },
+    ),
+    (
+        "-sl",
+        "--share-limits",
+        {
+            "dest": "share_limits",
+            "action": "store_true",
+            "default": False,
+            "help": (
+                "Use this to help apply and manage your torrent share limits based on your tags/categories."
+                "This can apply a max ratio, seed time limits to your torrents or limit your torrent upload speed as well."
+                "Share limits are applied in the order of priority specified."
+            ),
+        },
+    ),
+    (
+        "-sc",
+        "--skip-cleanup",
+        {
+            "dest": "skip_cleanup",
+            "action": "store_true",
+            "default": False,
+            "help": "Use this to skip cleaning up Recycle Bin/Orphaned directory.",
+        },
+    ),
+    (
+        "-svc",
+        "--skip-qb-version-check",
+        {
+            "dest": "skip_qb_version_check",
+            "action": "store_true",
+            "default": False,
+            # "help": "Bypass qBittorrent/libtorrent version compatibility check. "
+            # "You run the risk of undesirable behavior and will receive no support.",
+            "help": argparse.SUPPRESS,
+        },
+    ),
+    (
+        "-dr",
+        "--dry-run",
+        {
+            "dest": "dry_run",
+            "action": "store_true",
+            "default": False,
+            "help": "If you would like to see what is gonna happen but not actually move/delete or tag/categorize anything.",
+        },
+    ),
+    (
+        "-ll",
+        "--log-level",
+        {
+            "dest": "log_level",
+            "action": "store",
+            "default": "INFO",
+            "type": str,
+            "help": "Change your log level.",
+        },
+    ),
+    (
+        "-d",
+        "--divider",
+        {
+            "dest": "divider",
+            "help": "Character that divides the sections (Default: '=')",
+            "default": "=",
+            "type": str,
+        },
+    ),
+    (
+        "-w",
+        "--width",
+        {
+            "dest": "width",
+            "help": "Screen Width (Default: 100)",
+            "default": 100,
+            "type": int,
+        },
+    ),
+    (
+        "-ls",
+        "--log-size",
+        {
+            "dest": "log_size",
+            "action": "store",
+            "default": 10,
+            "type": int,
+            "help": "Maximum log size per file (in MB)",
+        },
+    ),
+    (
+        "-lc",
+        "--log-count",
+        {
+            "dest": "log_count",
+            "action": "store",
+            "default": 5,
+            "type": int,
+            "help": "Maximum mumber of logs to keep",
+        },
+    ),
+]
+
+parser = argparse.ArgumentParser("qBittorrent Manager.", description="A mix of scripts combined for managing qBittorrent.")
+for short_flag, long_flag, options in ARGUMENTS:
+    parser.add_argument(short_flag, long_flag, **options)
 args = parser.parse_args()
 
 
@@ -222,7 +319,7 @@ def get_arg(env_str, default, arg_bool=False, arg_int=False):
         if arg_bool:
             if final_value is True or final_value is False:
                 return final_value
-            elif final_value.lower() in ["t", "true"]:
+            elif final_value.lower() in ["t", "true", "y", "yes", "1"]:
                 return True
             else:
                 return False
@@ -237,25 +334,56 @@ def get_arg(env_str, default, arg_bool=False, arg_int=False):
         return default
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=32)
+def _cron_template(cron_expression):
+    """Parse a cron expression once and reuse the croniter object for subsequent calls"""
+    return croniter(str(cron_expression))
+
+
+# Cheap shape check (an @alias or 5-7 whitespace separated fields) to reject obvious non-cron values before croniter
+CRON_SYNTAX_REGEX = re.compile(r"^\s*(@\w+|[\w*?,/#-]+(\s+[\w*?,/#-]+){4,6})\s*$")
+
+
+@lru_cache(maxsize=32)
 def is_valid_cron_syntax(cron_expression):
+    if not CRON_SYNTAX_REGEX.match(str(cron_expression)):
+        return False
     try:
-        croniter(str(cron_expression))
+        _cron_template(cron_expression)
         return True
     except (ValueError, KeyError):
         return False
 
 
-try:
-    from git import InvalidGitRepositoryError
-    from git import Repo
-
+def find_config_files(directory, pattern):
+    """Return the names of the files in directory matching the config file pattern in a single directory scan"""
+    sub_dir, name_pattern = os.path.split(pattern)
+    include_hidden = name_pattern.startswith(".")
+    try:
+        with os.scandir(os.path.join(directory, sub_dir)) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if (include_hidden or not entry.name.startswith("."))
+                and entry.is_file()
+                and fnmatch.fnmatch(entry.name, name_pattern)
+            ]
+    except OSError:
+        return []
+
+
+def get_git_branch():
+    """Get the current git branch, importing GitPython only when it is needed"""
     try:
-        git_branch = Repo(path=".").head.ref.name  # noqa
+        from git import InvalidGitRepositoryError
+        from git import Repo
+    except ImportError:
+        return None
+    try:
+        return Repo(path=".").head.ref.name  # noqa
     except InvalidGitRepositoryError:
-        git_branch = None
-except ImportError:
-    git_branch = None
+        return None
+
 
 env_version = get_arg("BRANCH_NAME", "master")
 is_docker = get_arg("QBM_DOCKER", False, arg_bool=True)
@@ -288,52 +416,75 @@ if debug:
 if trace:
     log_level = "TRACE"
 
-stats = {}
-args = {}
-
-if os.path.isdir("/config") and glob.glob(os.path.join("/config", config_files)):
+stats = Counter()
+qbt_client_cache = {}
+scheduled_job = None
+scheduled_next_run = None
+
+# Run summary lines in display order, only shown when the stat is non-zero
+STATS_SUMMARY = [
+    ("categorized", "Total Torrents Categorized: {count}"),
+    ("tagged", "Total Torrents Tagged: {count}"),
+    ("rem_unreg", "Total Unregistered Torrents Removed: {count}"),
+    ("tagged_tracker_error", "Total {tracker_error_tag} Torrents Tagged: {count}"),
+    ("untagged_tracker_error", "Total {tracker_error_tag} Torrents untagged: {count}"),
+    ("added", "Total Torrents Added: {count}"),
+    ("resumed", "Total Torrents Resumed: {count}"),
+    ("rechecked", "Total Torrents Rechecked: {count}"),
+    ("deleted", "Total Torrents Deleted: {count}"),
+    ("deleted_contents", "Total Torrents + Contents Deleted : {count}"),
+    ("orphaned", "Total Orphaned Files: {count}"),
+    ("tagged_noHL", "Total {nohardlinks_tag} Torrents Tagged: {count}"),
+    ("untagged_noHL", "Total {nohardlinks_tag} Torrents untagged: {count}"),
+    ("updated_share_limits", "Total Share Limits Updated: {count}"),
+    ("cleaned_share_limits", "Total Torrents Removed from Meeting Share Limits: {count}"),
+    ("recycle_emptied", "Total Files Deleted from Recycle Bin: {count}"),
+    ("orphaned_emptied", "Total Files Deleted from Orphaned Data: {count}"),
+]
+
+config_matches = find_config_files("/config", config_files) if os.path.isdir("/config") else []
+if config_matches:
     default_dir = "/config"
 else:
     default_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+    config_matches = find_config_files(default_dir, config_files)
 
 
 if "*" not in config_files:
     config_files = [config_files]
 else:
-    glob_configs = glob.glob(os.path.join(default_dir, config_files))
-    if glob_configs:
-        config_files = [os.path.split(x)[-1] for x in glob_configs]
+    if config_matches:
+        config_files = config_matches
     else:
         print(f"Config Error: Unable to find any config files in the pattern '{config_files}'.")
         sys.exit(1)
 
 
-for v in [
-    "run",
-    "sch",
-    "startupDelay",
-    "config_files",
-    "log_file",
-    "recheck",
-    "cat_update",
-    "tag_update",
-    "rem_unregistered",
-    "tag_tracker_error",
-    "rem_orphaned",
-    "tag_nohardlinks",
-    "share_limits",
-    "skip_cleanup",
-    "skip_qb_version_check",
-    "dry_run",
-    "log_level",
-    "log_size",
-    "log_count",
-    "divider",
-    "screen_width",
-    "debug",
-    "trace",
-]:
-    args[v] = eval(v)
+args = {
+    "run": run,
+    "sch": sch,
+    "startupDelay": startupDelay,
+    "config_files": config_files,
+    "log_file": log_file,
+    "recheck": recheck,
+    "cat_update": cat_update,
+    "tag_update": tag_update,
+    "rem_unregistered": rem_unregistered,
+    "tag_tracker_error": tag_tracker_error,
+    "rem_orphaned": rem_orphaned,
+    "tag_nohardlinks": tag_nohardlinks,
+    "share_limits": share_limits,
+    "skip_cleanup": skip_cleanup,
+    "skip_qb_version_check": skip_qb_version_check,
+    "dry_run": dry_run,
+    "log_level": log_level,
+    "log_size": log_size,
+    "log_count": log_count,
+    "divider": divider,
+    "screen_width": screen_width,
+    "debug": debug,
+    "trace": trace,
+}
 
 if screen_width < 90 or screen_width > 300:
     print(f"Argument Error: width argument invalid: {screen_width} must be an integer between 90 and 300 using the default 100")
@@ -346,6 +497,8 @@ except ValueError:
     if not is_valid_cron_syntax(sch):
         print(f"Invalid Schedule: Please use a valid cron schedule or integer (minutes). Current value is set to '{sch}'")
         sys.exit(1)
+# A schedule that is not an integer has already been validated as cron syntax
+sch_is_cron = isinstance(sch, str)
 
 # Check if StartupDelay parameter is a number
 try:
@@ -360,13 +513,6 @@ from modules import util  # noqa
 
 util.logger = logger
 from modules.config import Config  # noqa
-from modules.core.category import Category  # noqa
-from modules.core.recheck import ReCheck  # noqa
-from modules.core.remove_orphaned import RemoveOrphaned  # noqa
-from modules.core.remove_unregistered import RemoveUnregistered  # noqa
-from modules.core.share_limits import ShareLimits  # noqa
-from modules.core.tag_nohardlinks import TagNoHardLinks  # noqa
-from modules.core.tags import Tags  # noqa
 from modules.util import Failed  # noqa
 from modules.util import GracefulKiller  # noqa
 
@@ -383,15 +529,22 @@ sys.excepthook = my_except_hook
 
 version = ("Unknown", "Unknown", 0)
 with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "VERSION")) as handle:
-    for line in handle.readlines():
-        line = line.strip()
-        if len(line) > 0:
-            version = util.parse_version(line)
-            break
-branch = util.guess_branch(version, env_version, git_branch)
-if branch is None:
-    branch = "Unknown"
-version = (version[0].replace("develop", branch), version[1].replace("develop", branch), version[2])
+    version_line = next((line.strip() for line in handle if line.strip()), None)
+if version_line:
+    version = util.parse_version(version_line)
+git_branch = None
+branch = None
+
+
+def resolve_branch():
+    """Resolve the git branch and branch specific version once, on the first call"""
+    global version, git_branch, branch
+    if branch is None:
+        git_branch = get_git_branch()
+        branch = util.guess_branch(version, env_version, git_branch)
+        if branch is None:
+            branch = "Unknown"
+        version = (version[0].replace("develop", branch), version[1].replace("develop", branch), version[2])
 
 
 def start_loop(first_run=False):
@@ -425,25 +578,7 @@ def start():
     end_time = None
     next_run = None
     global stats
-    stats = {
-        "added": 0,
-        "deleted": 0,
-        "deleted_contents": 0,
-        "resumed": 0,
-        "rechecked": 0,
-        "orphaned": 0,
-        "recycle_emptied": 0,
-        "orphaned_emptied": 0,
-        "tagged": 0,
-        "categorized": 0,
-        "rem_unreg": 0,
-        "tagged_tracker_error": 0,
-        "untagged_tracker_error": 0,
-        "tagged_noHL": 0,
-        "untagged_noHL": 0,
-        "updated_share_limits": 0,
-        "cleaned_share_limits": 0,
-    }
+    stats = Counter({key: 0 for key, _ in STATS_SUMMARY})
 
     def finished_run():
         """Handle the end of a run"""
@@ -451,16 +586,15 @@ def start():
         end_time = datetime.now()
         run_time = str(end_time - start_time).split(".", maxsplit=1)[0]
         if run is False:
-            # Simple check to guess if it's a cron syntax
-            if is_valid_cron_syntax(sch):
-                next_run_time = schedule_from_cron(sch)
+            if sch_is_cron:
+                next_run_time = schedule_from_cron(sch, end_time)
             else:
                 delta = timedelta(minutes=sch)
                 logger.info(f"    Scheduled Mode: Running every {precisedelta(delta)}.")
-                next_run_time = schedule_every_x_minutes(sch)
+                next_run_time = schedule_every_x_minutes(sch, end_time)
         else:
-            next_run_time = datetime.now()
-        nxt_run = calc_next_run(next_run_time)
+            next_run_time = end_time
+        nxt_run = calc_next_run(next_run_time, end_time)
         next_run_str = nxt_run["next_run_str"]
         next_run = nxt_run["next_run"]
         body = logger.separator(
@@ -470,7 +604,7 @@ def start():
         return next_run, body
 
     try:
-        cfg = Config(default_dir, args)
+        cfg = Config(default_dir, args, qbt_client_cache)
         qbit_manager = cfg.qbt
     except Exception as ex:
         logger.stacktrace()
@@ -482,88 +616,84 @@ def start():
     if qbit_manager:
         # Set Category
         if cfg.commands["cat_update"]:
-            stats["categorized"] += Category(qbit_manager).stats
+            from modules.core.category import Category
+
+            stats.update({"categorized": Category(qbit_manager).stats})
 
         # Set Tags
         if cfg.commands["tag_update"]:
-            stats["tagged"] += Tags(qbit_manager).stats
+            from modules.core.tags import Tags
+
+            stats.update({"tagged": Tags(qbit_manager).stats})
 
         # Remove Unregistered Torrents and tag errors
         if cfg.commands["rem_unregistered"] or cfg.commands["tag_tracker_error"]:
+            from modules.core.remove_unregistered import RemoveUnregistered
+
             rem_unreg = RemoveUnregistered(qbit_manager)
-            stats["rem_unreg"] += rem_unreg.stats_deleted + rem_unreg.stats_deleted_contents
-            stats["deleted"] += rem_unreg.stats_deleted
-            stats["deleted_contents"] += rem_unreg.stats_deleted_contents
-            stats["tagged_tracker_error"] += rem_unreg.stats_tagged
-            stats["untagged_tracker_error"] += rem_unreg.stats_untagged
-            stats["tagged"] += rem_unreg.stats_tagged
+            stats.update(
+                {
+                    "rem_unreg": rem_unreg.stats_deleted + rem_unreg.stats_deleted_contents,
+                    "deleted": rem_unreg.stats_deleted,
+                    "deleted_contents": rem_unreg.stats_deleted_contents,
+                    "tagged_tracker_error": rem_unreg.stats_tagged,
+                    "untagged_tracker_error": rem_unreg.stats_untagged,
+                    "tagged": rem_unreg.stats_tagged,
+                }
+            )
 
         # Recheck Torrents
         if cfg.commands["recheck"]:
+            from modules.core.recheck import ReCheck
+
             recheck = ReCheck(qbit_manager)
-            stats["resumed"] += recheck.stats_resumed
-            stats["rechecked"] += recheck.stats_rechecked
+            stats.update({"resumed": recheck.stats_resumed, "rechecked": recheck.stats_rechecked})
 
         # Tag NoHardLinks
         if cfg.commands["tag_nohardlinks"]:
+            from modules.core.tag_nohardlinks import TagNoHardLinks
+
             no_hardlinks = TagNoHardLinks(qbit_manager)
-            stats["tagged"] += no_hardlinks.stats_tagged
-            stats["tagged_noHL"] += no_hardlinks.stats_tagged
-            stats["untagged_noHL"] += no_hardlinks.stats_untagged
+            stats.update(
+                {
+                    "tagged": no_hardlinks.stats_tagged,
+                    "tagged_noHL": no_hardlinks.stats_tagged,
+                    "untagged_noHL": no_hardlinks.stats_untagged,
+                }
+            )
 
         # Set Share Limits
         if cfg.commands["share_limits"]:
+            from modules.core.share_limits import ShareLimits
+
             share_limits = ShareLimits(qbit_manager)
-            stats["tagged"] += share_limits.stats_tagged
-            stats["updated_share_limits"] += share_limits.stats_tagged
-            stats["deleted"] += share_limits.stats_deleted
-            stats["deleted_contents"] += share_limits.stats_deleted_contents
-            stats["cleaned_share_limits"] += share_limits.stats_deleted + share_limits.stats_deleted_contents
+            stats.update(
+                {
+                    "tagged": share_limits.stats_tagged,
+                    "updated_share_limits": share_limits.stats_tagged,
+                    "deleted": share_limits.stats_deleted,
+                    "deleted_contents": share_limits.stats_deleted_contents,
+                    "cleaned_share_limits": share_limits.stats_deleted + share_limits.stats_deleted_contents,
+                }
+            )
 
         # Remove Orphaned Files
         if cfg.commands["rem_orphaned"]:
-            stats["orphaned"] += RemoveOrphaned(qbit_manager).stats
+            from modules.core.remove_orphaned import RemoveOrphaned
+
+            stats.update({"orphaned": RemoveOrphaned(qbit_manager).stats})
 
         # Empty RecycleBin
-        stats["recycle_emptied"] += cfg.cleanup_dirs("Recycle Bin")
+        stats.update({"recycle_emptied": cfg.cleanup_dirs("Recycle Bin")})
 
         # Empty Orphaned Directory
-        stats["orphaned_emptied"] += cfg.cleanup_dirs("Orphaned Data")
-
-    if stats["categorized"] > 0:
-        stats_summary.append(f"Total Torrents Categorized: {stats['categorized']}")
-    if stats["tagged"] > 0:
-        stats_summary.append(f"Total Torrents Tagged: {stats['tagged']}")
-    if stats["rem_unreg"] > 0:
-        stats_summary.append(f"Total Unregistered Torrents Removed: {stats['rem_unreg']}")
-    if stats["tagged_tracker_error"] > 0:
-        stats_summary.append(f"Total {cfg.tracker_error_tag} Torrents Tagged: {stats['tagged_tracker_error']}")
-    if stats["untagged_tracker_error"] > 0:
-        stats_summary.append(f"Total {cfg.tracker_error_tag} Torrents untagged: {stats['untagged_tracker_error']}")
-    if stats["added"] > 0:
-        stats_summary.append(f"Total Torrents Added: {stats['added']}")
-    if stats["resumed"] > 0:
-        stats_summary.append(f"Total Torrents Resumed: {stats['resumed']}")
-    if stats["rechecked"] > 0:
-        stats_summary.append(f"Total Torrents Rechecked: {stats['rechecked']}")
-    if stats["deleted"] > 0:
-        stats_summary.append(f"Total Torrents Deleted: {stats['deleted']}")
-    if stats["deleted_contents"] > 0:
-        stats_summary.append(f"Total Torrents + Contents Deleted : {stats['deleted_contents']}")
-    if stats["orphaned"] > 0:
-        stats_summary.append(f"Total Orphaned Files: {stats['orphaned']}")
-    if stats["tagged_noHL"] > 0:
-        stats_summary.append(f"Total {cfg.nohardlinks_tag} Torrents Tagged: {stats['tagged_noHL']}")
-    if stats["untagged_noHL"] > 0:
-        stats_summary.append(f"Total {cfg.nohardlinks_tag} Torrents untagged: {stats['untagged_noHL']}")
-    if stats["updated_share_limits"] > 0:
-        stats_summary.append(f"Total Share Limits Updated: {stats['updated_share_limits']}")
-    if stats["cleaned_share_limits"] > 0:
-        stats_summary.append(f"Total Torrents Removed from Meeting Share Limits: {stats['cleaned_share_limits']}")
-    if stats["recycle_emptied"] > 0:
-        stats_summary.append(f"Total Files Deleted from Recycle Bin: {stats['recycle_emptied']}")
-    if stats["orphaned_emptied"] > 0:
-        stats_summary.append(f"Total Files Deleted from Orphaned Data: {stats['orphaned_emptied']}")
+        stats.update({"orphaned_emptied": cfg.cleanup_dirs("Orphaned Data")})
+
+    stats_summary.extend(
+        fmt.format(count=stats[key], tracker_error_tag=cfg.tracker_error_tag, nohardlinks_tag=cfg.nohardlinks_tag)
+        for key, fmt in STATS_SUMMARY
+        if stats[key] > 0
+    )
 
     finished_run()
     if cfg:
@@ -581,56 +711,85 @@ def end():
     sys.exit(0)
 
 
-def calc_next_run(next_run_time):
+@lru_cache(maxsize=64)
+def format_time_until(minutes):
+    """Format the number of minutes until the next run, memoized since the same values recur every run"""
+    return precisedelta(timedelta(minutes=minutes), minimum_unit="minutes", format="%d")
+
+
+def calc_next_run(next_run_time, current_time=None):
     """Calculates the next run time based on the schedule"""
-    current_time = datetime.now()
+    if run is not False:
+        return {"next_run": None, "next_run_str": ""}
+    if current_time is None:
+        current_time = datetime.now()
     current = current_time.strftime("%I:%M %p")
     time_to_run_str = next_run_time.strftime("%Y-%m-%d %I:%M %p")
-    delta_seconds = (next_run_time - current_time).total_seconds()
-    time_until = precisedelta(timedelta(minutes=math.ceil(delta_seconds / 60)), minimum_unit="minutes", format="%d")
-    next_run = {}
-    if run is False:
-        next_run["next_run"] = next_run_time
-        next_run["next_run_str"] = f"Current Time: {current} | {time_until} until the next run at {time_to_run_str}"
-    else:
-        next_run["next_run"] = None
-        next_run["next_run_str"] = ""
-    return next_run
+    # Round up to whole minutes using exact timedelta floor division
+    time_until = format_time_until(-((current_time - next_run_time) // timedelta(minutes=1)))
+    return {
+        "next_run": next_run_time,
+        "next_run_str": f"Current Time: {current} | {time_until} until the next run at {time_to_run_str}",
+    }
 
 
-def schedule_from_cron(cron_expression):
-    schedule.clear()
-    base_time = datetime.now()
+def schedule_from_cron(cron_expression, base_time=None):
+    """Record the next cron run time, creating the scheduled job on first use"""
+    global scheduled_job, scheduled_next_run
+    if base_time is None:
+        base_time = datetime.now()
     try:
-        iter = croniter(cron_expression, base_time)
+        iter = _cron_template(cron_expression)
+        iter.set_current(base_time, force=True)
         next_run_time = iter.get_next(datetime)
     except Exception as e:
         logger.error(f"Invalid Cron Syntax: {cron_expression}. {e}")
         logger.stacktrace()
         sys.exit(1)
-    delay = (next_run_time - base_time).total_seconds()
-    schedule.every(delay).seconds.do(start_loop)
+    if scheduled_job is None:
+        delay = (next_run_time - base_time).total_seconds()
+        scheduled_job = schedule.every(delay).seconds.do(start_loop)
+    scheduled_next_run = next_run_time
     return next_run_time
 
 
-def schedule_every_x_minutes(min):
-    schedule.clear()
-    schedule.every(min).minutes.do(start_loop)
-    next_run_time = datetime.now() + timedelta(minutes=min)
-    return next_run_time
+def schedule_every_x_minutes(min, base_time=None):
+    """Record the next run time x minutes from base_time, creating the scheduled job on first use"""
+    global scheduled_job, scheduled_next_run
+    if base_time is None:
+        base_time = datetime.now()
+    if scheduled_job is None:
+        scheduled_job = schedule.every(min).minutes.do(start_loop)
+    scheduled_next_run = base_time + timedelta(minutes=min)
+    return scheduled_next_run
+
+
+def rearm_scheduled_job():
+    """Move the scheduled job onto the next run time recorded by the last finished run"""
+    # Job.run() reschedules the job from its interval once start_loop() returns, so this has to be
+    # applied after the job has run rather than from inside the run itself
+    if scheduled_job is not None and scheduled_next_run is not None:
+        scheduled_job.next_run = scheduled_next_run
+    return schedule.next_run()
+
+
+LOGO = (
+    "        _     _ _                                            ",  # noqa: W605
+    "       | |   (_) |                                           ",  # noqa: W605
+    "   __ _| |__  _| |_   _ __ ___   __ _ _ __   __ _  __ _  ___ ",  # noqa: W605
+    "  / _` | '_ \\| | __| | '_ ` _ \\ / _` | '_ \\ / _` |/ _` |/ _ \\",  # noqa: W605
+    " | (_| | |_) | | |_  | | | | | | (_| | | | | (_| | (_| |  __/",  # noqa: W605
+    r"  \__, |_.__/|_|\__| |_| |_| |_|\__,_|_| |_|\__,_|\__, |\___|",  # noqa: W605
+    "     | |         ______                            __/ |     ",  # noqa: W605
+    "     |_|        |______|                          |___/      ",  # noqa: W605
+)
 
 
 def print_logo(logger):
-    global is_docker, version, git_branch
+    global is_docker
+    resolve_branch()
     logger.separator()
-    logger.info_center("        _     _ _                                            ")  # noqa: W605
-    logger.info_center("       | |   (_) |                                           ")  # noqa: W605
-    logger.info_center("   __ _| |__  _| |_   _ __ ___   __ _ _ __   __ _  __ _  ___ ")  # noqa: W605
-    logger.info_center("  / _` | '_ \\| | __| | '_ ` _ \\ / _` | '_ \\ / _` |/ _` |/ _ \\")  # noqa: W605
-    logger.info_center(" | (_| | |_) | | |_  | | | | | | (_| | | | | (_| | (_| |  __/")  # noqa: W605
-    logger.info_center(r"  \__, |_.__/|_|\__| |_| |_| |_|\__,_|_| |_|\__,_|\__, |\___|")  # noqa: W605
-    logger.info_center("     | |         ______                            __/ |     ")  # noqa: W605
-    logger.info_center("     |_|        |______|                          |___/      ")  # noqa: W605
+    logger.info_center(LOGO)
     system_ver = "Docker" if is_docker else f"Python {platform.python_version()}"
     logger.info(f"    Version: {version[0]} ({system_ver}){f' (Git: {git_branch})' if git_branch else ''}")
     latest_version = util.current_version(version, branch=branch)
@@ -654,11 +813,12 @@ if __name__ == "__main__":
             logger.info(run_mode_message)
             start_loop(True)
         else:
-            # Simple check to guess if it's a cron syntax
-            if is_valid_cron_syntax(sch):
+            if sch_is_cron:
                 run_mode_message = f"    Scheduled Mode: Running cron '{sch}'"
-                next_run_time = schedule_from_cron(sch)
-                next_run = calc_next_run(next_run_time)
+                now = datetime.now()
+                next_run_time = schedule_from_cron(sch, now)
+                rearm_scheduled_job()
+                next_run = calc_next_run(next_run_time, now)
                 run_mode_message += f"\n     {next_run['next_run_str']}"
                 logger.info(run_mode_message)
             else:
@@ -668,16 +828,23 @@ if __name__ == "__main__":
                 if startupDelay:
                     run_mode_message += f"\n    Startup Delay: Initial Run will start after {startupDelay} seconds"
                     logger.info(run_mode_message)
-                    time.sleep(startupDelay)
+                    killer.event.wait(startupDelay)
                 else:
                     logger.info(run_mode_message)
-                start_loop(True)
+                if not killer.event.is_set():
+                    start_loop(True)
+                    next_run_time = rearm_scheduled_job()
 
-            while not killer.kill_now:
-                next_run = calc_next_run(next_run_time)
+            while not killer.event.is_set():
+                previous_run_time = schedule.next_run()
                 schedule.run_pending()
+                if schedule.next_run() != previous_run_time:
+                    next_run_time = rearm_scheduled_job()
+                    next_run = calc_next_run(next_run_time)
                 logger.trace(f"    Pending Jobs: {schedule.get_jobs()}")
-                time.sleep(60)
+                # Sleep until the next job is due (capped to guard against clock changes), waking early on SIGTERM
+                idle_seconds = schedule.idle_seconds()
+                killer.event.wait(max(1, min(60, idle_seconds if idle_seconds is not None else 60)))
             end()
     except KeyboardInterrupt:
         end()